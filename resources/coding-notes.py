@@ -1,5 +1,9 @@
+from datetime import date
 from pathlib import Path
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
 
 # project root = two levels up from this notebook
 PROC_DIR = Path.cwd().parents[1] / "data" / "01_processed" / "elset_history_aodr"
@@ -7,11 +11,23 @@ print(PROC_DIR)  # sanity check
 day = "2025-01-01"
 day_dir = PROC_DIR / f"epoch_date={day}"
 
-# read the whole partition (all files in that directory)
-df_day = pd.read_parquet(day_dir)
+# only read the columns / satellites we need; row-group stats let pyarrow skip the rest
+cols = ["satNo", "epoch", "semiMajorAxis", "eccentricity", "inclination"]
+wanted_ids = [25544, 48274]  # ISS, Tiangong
+
+# read the partition (all files in that directory), memory-mapped
+df_day = pd.read_parquet(day_dir, engine="pyarrow", memory_map=True, dtype_backend="pyarrow",
+                         columns=cols, filters=[("satNo", "in", wanted_ids)])
 df_day.head()
 # Load multiple days
 days = ["2025-01-01", "2025-01-02"]
-paths = [PROC_DIR / f"epoch_date={d}" for d in days]
-df = pd.concat([pd.read_parquet(p) for p in paths], ignore_index=True)
+# one Arrow scan over the dataset, pruned to those partitions (no per-day frames + concat)
+local_mmap = pafs.LocalFileSystem(use_mmap=True)  # page in only what the scan touches
+part = ds.partitioning(pa.schema([("epoch_date", pa.date32())]), flavor="hive")
+dset = ds.dataset(str(PROC_DIR), format="parquet", partitioning=part, filesystem=local_mmap)
+day_filter = ds.field("epoch_date").isin([date.fromisoformat(d) for d in days])
+tbl = dset.to_table(columns=cols + ["epoch_date"], filter=day_filter, use_threads=True)
+# Arrow-backed dtypes: nullable satNo stays int64[pyarrow] (no float64/NaN upcast), buffers shared
+df = tbl.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+del tbl  # buffers were handed over by self_destruct
 df.head()
\ No newline at end of file
@@ -1,13 +1,24 @@
+import functools
 import os
+import shutil
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from urllib.parse import urlparse
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib3.util.retry import Retry
 from dotenv import load_dotenv, find_dotenv
 
+# Optional faster inflate for zipfile (python-isal); stdlib zlib otherwise
+try:
+    import isal.isal_zlib as _isal_zlib  # type: ignore
+    zipfile.zlib = _isal_zlib
+except Exception:
+    pass
+
 # ---------------- Env & Dirs ----------------
 load_dotenv(find_dotenv())
 
@@ -27,6 +38,7 @@ def resolve_dirs():
     return data_dir, raw_dir, processed_dir, final_dir
 
 # ---------------- Auth ----------------
+@functools.lru_cache(maxsize=1)
 def token_header_basic():
     """
     UDL bulk links may be public (pre-signed) or require auth.
@@ -44,17 +56,24 @@ def token_header_basic():
     return {}
 
 # ---------------- HTTP Session ----------------
-def make_session():
+RANGE_CHUNKS = 5  # parallel Range GETs per large file
+
+def make_session(pool_size: int = 16):
     s = requests.Session()
     retries = Retry(
         total=6,
         backoff_factor=1.4,
         status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["GET"],
+        allowed_methods=["HEAD", "GET"],
         respect_retry_after_header=True,
         raise_on_status=False,
     )
-    s.mount("https://", HTTPAdapter(max_retries=retries))
+    # pool_size: peak concurrent connections to one host, so keep-alive sockets aren't discarded
+    s.mount("https://", HTTPAdapter(max_retries=retries, pool_connections=16, pool_maxsize=pool_size))
+    # Auth set once on the session instead of being passed to every request
+    s.headers.update(token_header_basic())
+    # Every encoding urllib3 can decode here (gzip, deflate, + br/zstd when brotli/zstandard are installed)
+    s.headers["Accept-Encoding"] = ACCEPT_ENCODING
     return s
 
 # ---------------- Utilities ----------------
@@ -67,36 +86,112 @@ def safe_filename_from_url(url: str) -> str:
 
 def read_urls(urls_path: Path) -> list[str]:
     with urls_path.open("r", encoding="utf-8") as f:
-        urls = [ln.strip() for ln in f if ln.strip() and not ln.strip().startswith("#")]
-    # de-dup while preserving order
-    seen, deduped = set(), []
-    for u in urls:
-        if u not in seen:
-            deduped.append(u); seen.add(u)
-    return deduped
-
-def download_zip(session: requests.Session, url: str, headers: dict, out_zip: Path) -> None:
+        # de-dup while preserving order (dict keys are an ordered set)
+        stripped = (ln.strip() for ln in f)
+        return list(dict.fromkeys(u for u in stripped if u and not u.startswith("#")))
+
+def _stream_to_file(r: requests.Response, out_zip: Path) -> None:
+    # Copy straight from the socket in 1 MiB blocks; any Content-Encoding is undone in urllib3
+    r.raw.decode_content = True
+    with open(out_zip, "wb") as fh:
+        shutil.copyfileobj(r.raw, fh, length=1024 * 1024)
+
+def download_zip(session: requests.Session, url: str, out_zip: Path) -> None:
     # stream download
-    with session.get(url, headers=headers, stream=True, timeout=300) as r:
+    with session.get(url, stream=True, timeout=300) as r:
         # If bulk links are public, auth header is harmless; if required, it helps
         if r.status_code == 401 or r.status_code == 403:
             # Retry once without auth in case it's a pre-signed public link
-            with session.get(url, stream=True, timeout=300) as r2:
+            with session.get(url, headers={"Authorization": None}, stream=True, timeout=300) as r2:
                 r2.raise_for_status()
-                with open(out_zip, "wb") as fh:
-                    for chunk in r2.iter_content(chunk_size=1024 * 256):
-                        if chunk:
-                            fh.write(chunk)
+                _stream_to_file(r2, out_zip)
             return
         r.raise_for_status()
-        with open(out_zip, "wb") as fh:
-            for chunk in r.iter_content(chunk_size=1024 * 256):
-                if chunk:
-                    fh.write(chunk)
+        _stream_to_file(r, out_zip)
+
+def _fetch_range(session: requests.Session, url: str, out_zip: Path, a: int, b: int) -> bool:
+    # GET bytes [a, b) and write them at offset a; False if the server ignored Range
+    # identity encoding so the byte offsets refer to the file itself
+    rng = {"Range": f"bytes={a}-{b - 1}", "Accept-Encoding": "identity"}
+    with session.get(url, headers=rng, stream=True, timeout=300) as r:
+        r.raise_for_status()
+        if r.status_code != 206:
+            return False
+        # own handle per range thread (portable, unlike os.pwrite)
+        with open(out_zip, "r+b") as fh:
+            fh.seek(a)
+            shutil.copyfileobj(r.raw, fh, length=1024 * 1024)
+            offset = fh.tell()
+    if offset != b:
+        raise requests.HTTPError(f"Short range read for {url}: got {offset - a:,} of {b - a:,} bytes")
+    return True
+
+def download_zip_ranged(session: requests.Session, url: str, out_zip: Path,
+                        nchunks: int = RANGE_CHUNKS, min_size: int = 64 * 1024 * 1024) -> None:
+    # Large files: N parallel Range GETs into a preallocated file; anything else -> single stream
+    # identity, like the range GETs, so Content-Length is the size of the file itself
+    r = session.head(url, headers={"Accept-Encoding": "identity"}, allow_redirects=True, timeout=60)
+    size = int(r.headers.get("Content-Length") or 0) if r.ok else 0
+    if size < min_size or r.headers.get("Accept-Ranges") != "bytes":
+        download_zip(session, url, out_zip)
+        return
+
+    step = -(-size // nchunks)  # ceil
+    ranges = [(a, min(a + step, size)) for a in range(0, size, step)]
+    with open(out_zip, "wb") as fh:
+        os.truncate(fh.fileno(), size)
+    with ThreadPoolExecutor(max_workers=len(ranges)) as ex:
+        futs = [ex.submit(_fetch_range, session, url, out_zip, a, b) for a, b in ranges]
+        ok = all(f.result() for f in futs)
+    if not ok:
+        # Server answered 200 instead of 206; redo as a plain stream
+        download_zip(session, url, out_zip)
 
 def unzip_file(zpath: Path, dest: Path) -> None:
+    # Stream each entry to disk in 1 MiB blocks instead of extractall
+    root = dest.resolve()
     with zipfile.ZipFile(zpath, "r") as zf:
-        zf.extractall(dest)
+        for info in zf.infolist():
+            out = (dest / info.filename).resolve()
+            if not out.is_relative_to(root):
+                # absolute or ../ member: skip it, extract the rest
+                print(f"  !! {zpath.name}: skipping unsafe member path {info.filename!r}")
+                continue
+            if info.is_dir():
+                out.mkdir(parents=True, exist_ok=True)
+                continue
+            out.parent.mkdir(parents=True, exist_ok=True)
+            with zf.open(info) as src, open(out, "wb") as dst:
+                shutil.copyfileobj(src, dst, length=1024 * 1024)
+
+def _fetch_one(session: requests.Session, url: str, dest: Path, i: int) -> Path:
+    fname = safe_filename_from_url(url)
+    zpath = dest / f"{i:03d}_{fname}"
+
+    try:
+        download_zip_ranged(session, url, zpath)
+    except requests.HTTPError as e:
+        # Show server hints (e.g., Retry-After)
+        ra = getattr(e.response, "headers", {}).get("Retry-After")
+        if ra and ra.isdigit():
+            sleep_s = int(ra)
+            print(f"  [{i}] HTTP error: {e}; server asked to retry after {sleep_s}s. Sleeping…")
+            time.sleep(sleep_s)
+            # one retry
+            download_zip_ranged(session, url, zpath)
+        else:
+            raise
+    print(f"  [{i}] ✓ Downloaded {zpath.name} ({zpath.stat().st_size:,} bytes)")
+    return zpath
+
+def _unzip_one(zpath: Path, dest: Path, i: int, keep_zip: bool = True) -> None:
+    try:
+        unzip_file(zpath, dest)
+        print(f"  [{i}] ✓ Unzipped into {dest}")
+        if not keep_zip:
+            zpath.unlink(missing_ok=True)
+    except zipfile.BadZipFile:
+        print(f"  [{i}] !! {zpath.name} is not a zip file or corrupted; leaving as-is.")
 
 # ---------------- Main ----------------
 if __name__ == "__main__":
@@ -112,43 +207,42 @@ if __name__ == "__main__":
         raise ValueError(f"No URLs found in {urls_file}")
 
     print(f"Found {len(urls)} URLs in {urls_file}")
-    s = make_session()
-    headers = token_header_basic()
 
     keep_zip = True  # set to False if you want to delete zips after extracting
-    min_interval_sec = 2.0  # gentle pacing between files
-
-    for i, url in enumerate(urls, start=1):
-        fname = safe_filename_from_url(url)
-        zpath = RAW / f"{i:03d}_{fname}"
-        print(f"[{i}/{len(urls)}] Downloading -> {zpath.name}")
-
-        try:
-            download_zip(s, url, headers, zpath)
-            print(f"  ✓ Downloaded {zpath.stat().st_size:,} bytes")
-        except requests.HTTPError as e:
-            # Show server hints (e.g., Retry-After)
-            print("  HTTP error:", e)
-            ra = getattr(e.response, "headers", {}).get("Retry-After")
-            if ra and ra.isdigit():
-                sleep_s = int(ra)
-                print(f"  Server asked to retry after {sleep_s}s. Sleeping…")
-                time.sleep(sleep_s)
-                # one retry
-                download_zip(s, url, headers, zpath)
-                print(f"  ✓ Downloaded after retry: {zpath.stat().st_size:,} bytes")
-            else:
-                raise
-
-        # Unzip
-        try:
-            unzip_file(zpath, RAW)
-            print(f"  ✓ Unzipped into {RAW}")
-            if not keep_zip:
-                zpath.unlink(missing_ok=True)
-        except zipfile.BadZipFile:
-            print("  !! Not a zip file or corrupted; leaving as-is.")
-
-        time.sleep(min_interval_sec)
-
+    # Concurrent downloads; the session's Retry (429 + Retry-After) handles backpressure
+    workers = int(os.getenv("BULK_WORKERS", "6"))
+    # each worker may fan out into RANGE_CHUNKS ranged GETs on a large file
+    s = make_session(pool_size=workers * RANGE_CHUNKS)
+
+    failed = []
+    # Unzip on its own small pool so extraction overlaps with the downloads still running
+    with ThreadPoolExecutor(max_workers=workers) as ex, ThreadPoolExecutor(max_workers=2) as unzip_pool:
+        futs = {
+            ex.submit(_fetch_one, s, url, RAW, i): (i, url)
+            for i, url in enumerate(urls, start=1)
+        }
+        unzip_futs = {}
+        for done, f in enumerate(as_completed(futs), start=1):
+            i, url = futs[f]
+            try:
+                zpath = f.result()
+                print(f"[{done}/{len(urls)}] downloaded #{i}")
+            except Exception as e:
+                print(f"[{done}/{len(urls)}] !! #{i} failed: {e}")
+                failed.append(url)
+                continue
+            unzip_futs[unzip_pool.submit(_unzip_one, zpath, RAW, i, keep_zip)] = (i, url)
+
+        for f in as_completed(unzip_futs):
+            i, url = unzip_futs[f]
+            try:
+                f.result()
+            except Exception as e:
+                print(f"  !! #{i} unzip failed: {e}")
+                failed.append(url)
+
+    if failed:
+        print(f"{len(failed)} URL(s) failed:")
+        for url in failed:
+            print("  ", url)
     print(f"All done. Files are in: {RAW}")
@@ -1,9 +1,10 @@
-import os, json
+import os, json, queue, threading, time
+from functools import partial
 from pathlib import Path
-from datetime import datetime
-from typing import Iterator, Dict, List, Optional
-
-import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import BinaryIO, Iterator, Dict, List, Optional
+from uuid import uuid4
 
 # Optional streaming for big JSON arrays
 try:
@@ -12,12 +13,30 @@ try:
 except Exception:
     HAS_IJSON = False
 
+# Optional faster JSON codec; falls back to stdlib, configured to emit the same text as orjson
+_json_dumps = partial(json.dumps, separators=(",", ":"), ensure_ascii=False)
+try:
+    import orjson  # type: ignore
+    _loads = orjson.loads
+    def _dumps(o) -> str:
+        try:
+            return orjson.dumps(o).decode("utf-8")
+        except TypeError:  # e.g. ints wider than 64 bits
+            return _json_dumps(o)
+except Exception:
+    _loads = json.loads
+    _dumps = _json_dumps
+
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 
 RAW_SUBDIR = "00_raw"
 PROC_SUBDIR = "01_processed"
 DATASET_NAME = "elset_history_aodr"
+# Record of converted raw files (leading "_" keeps it out of Parquet dataset scans)
+MANIFEST_NAME = "_manifest.json"
 
 # Keep ALL columns by default; or set a subset to trim size
 COLUMNS_TO_KEEP: Optional[List[str]] = None
@@ -35,15 +54,12 @@ NUMERIC_AS_FLOAT = [
 # Nullable integer candidates
 NUMERIC_AS_INT = ["satNo","revNo","idElset","idOnOrbit","idOrbitDetermination"]
 
-# Columns that may be list/dict -> stringify
-OBJECTY_TO_JSON = ["tags"]
-
 def _to_text(x):
-    # Convert anything (including bool/bytes) to a clean str, leave NaN/NA as-is
-    if pd.isna(x):
-        return pd.NA
+    # Convert anything (including bool/bytes) to a clean str, leave None/NaN as null
+    if x is None or (isinstance(x, float) and x != x):
+        return None
     if isinstance(x, (list, dict)):
-        return json.dumps(x)
+        return _dumps(x)
     if isinstance(x, (bytes, bytearray)):
         try:
             return x.decode("utf-8", errors="replace")
@@ -53,12 +69,74 @@ def _to_text(x):
         return "true" if x else "false"
     return str(x)
 
+def _to_float(x):
+    if isinstance(x, (list, dict)):
+        return None
+    try:
+        return float(x)
+    except (TypeError, ValueError):
+        return None
+
+_INT64_MIN, _INT64_MAX = -2**63, 2**63 - 1
+
+def _to_int(x):
+    if type(x) is int:  # not bool: True goes through _to_float -> 1, like to_numeric
+        v = x
+    else:
+        f = _to_float(x)
+        if f is None or not f.is_integer():
+            return None
+        v = int(f)
+    # out of int64 range -> null, like to_numeric(errors="coerce") did
+    return v if _INT64_MIN <= v <= _INT64_MAX else None
+
+def _to_datetime(x):
+    if not isinstance(x, str):
+        return None
+    try:
+        dt = datetime.fromisoformat(x)
+    except ValueError:
+        return None
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+
 # Columns we will *always* stringify (common metadata fields that can be inconsistent)
 ALWAYS_STR_COLUMNS = [
     "uct", "classificationMarking", "origin", "source", "sourceDL",
-    "descriptor", "createdBy", "transactionId", "tags"  # 'tags' also handled as list/dict above
+    "descriptor", "createdBy", "transactionId", "tags"  # list/dict values (e.g. 'tags') become JSON text
 ]
 
+# Low-cardinality string columns worth dictionary-encoding in Parquet
+DICTIONARY_COLUMNS = ["classificationMarking", "origin", "source", "sourceDL", "descriptor", "createdBy", "uct"]
+
+# Parquet writer options: ZSTD pages, row-group statistics for filter pushdown on satNo/epoch
+PARQUET_WRITE_OPTIONS = dict(
+    compression="zstd",
+    compression_level=3,
+    use_dictionary=DICTIONARY_COLUMNS,
+    data_page_size=1 << 20,
+    write_statistics=True,
+)
+ROW_GROUP_SIZE = 256_000
+
+# Hive directory name for rows without an epoch (same as pyarrow's write_to_dataset)
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+# Fixed Arrow types for every known column; anything else in the feed is inferred per chunk
+STATIC_SCHEMA = pa.schema(
+    [pa.field(c, pa.timestamp("us", tz="UTC")) for c in DATE_COLS]
+    + [pa.field(c, pa.float64()) for c in NUMERIC_AS_FLOAT]
+    + [pa.field(c, pa.int64()) for c in NUMERIC_AS_INT]
+    + [pa.field(c, pa.string()) for c in ALWAYS_STR_COLUMNS]
+    + [pa.field("epoch_date", pa.date32())]
+)
+
+_COERCE = {
+    **{c: _to_datetime for c in DATE_COLS},
+    **{c: _to_float for c in NUMERIC_AS_FLOAT},
+    **{c: _to_int for c in NUMERIC_AS_INT},
+    **{c: _to_text for c in ALWAYS_STR_COLUMNS},
+}
+
 def resolve_dirs() -> tuple[Path, Path, Path]:
     here = Path(__file__).resolve().parent if "__file__" in globals() else Path.cwd()
     data_dir = Path(os.getenv("DATA_DIR", here.parent / "data"))
@@ -68,31 +146,25 @@ def resolve_dirs() -> tuple[Path, Path, Path]:
         d.mkdir(parents=True, exist_ok=True)
     return data_dir, raw_dir, proc_dir
 
-def detect_format(path: Path) -> str:
-    with path.open("rb") as f:
-        first = f.read(1)
-    return "array" if first == b"[" else "ndjson"
-
-def iter_records_ndjson(path: Path) -> Iterator[Dict]:
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                yield json.loads(line)
+def iter_records_ndjson(f: BinaryIO) -> Iterator[Dict]:
+    # bytes in, no strip: the parser tolerates surrounding whitespace
+    for line in f:
+        if not line.isspace():
+            yield _loads(line)
 
-def iter_records_array(path: Path) -> Iterator[Dict]:
+def iter_records_array(f: BinaryIO) -> Iterator[Dict]:
     if HAS_IJSON:
-        with path.open("rb") as f:
-            for obj in ijson.items(f, "item"):
-                yield obj
+        yield from ijson.items(f, "item")
     else:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        for obj in data:
-            yield obj
+        yield from _loads(f.read())
 
 def iter_records_any(path: Path) -> Iterator[Dict]:
-    return iter_records_array(path) if detect_format(path) == "array" else iter_records_ndjson(path)
+    # One open per file: peek at the first byte to pick array vs NDJSON
+    with path.open("rb") as f:
+        if f.peek(1)[:1] == b"[":
+            yield from iter_records_array(f)
+        else:
+            yield from iter_records_ndjson(f)
 
 def to_chunks(iterable: Iterator[Dict], chunk_size: int = 50000) -> Iterator[List[Dict]]:
     buf: List[Dict] = []
@@ -104,121 +176,268 @@ def to_chunks(iterable: Iterator[Dict], chunk_size: int = 50000) -> Iterator[Lis
     if buf:
         yield buf
 
-def normalize_chunk(records: List[Dict]) -> pd.DataFrame:
-    df = pd.json_normalize(records, max_level=1)
-
-    # Keep subset if requested
-    if COLUMNS_TO_KEEP:
-        cols = [c for c in COLUMNS_TO_KEEP if c in df.columns]
-        df = df.reindex(columns=cols)
-
-    # Stringify list/dict columns we know about (and any dynamic leftovers)
-    for col in OBJECTY_TO_JSON:
-        if col in df.columns:
-            df[col] = df[col].apply(lambda x: json.dumps(x) if isinstance(x, (list, dict)) else x)
-
-    # Also auto-stringify any other columns pandas typed as "object" but containing lists/dicts
-    for col in df.columns:
-        if df[col].dtype == "object":
-            # quick peek for non-scalars
-            sample = df[col].dropna().head(10).tolist()
-            if any(isinstance(x, (list, dict)) for x in sample):
-                df[col] = df[col].apply(lambda x: json.dumps(x) if isinstance(x, (list, dict)) else x)
-
-    # Coerce numerics (floats)
-    for col in NUMERIC_AS_FLOAT:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-
-    # Coerce integers (nullable)
-    for col in NUMERIC_AS_INT:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
-
-        # --- Force known metadata columns to string (handles bool/bytes/mixed) ---
-    for col in ALWAYS_STR_COLUMNS:
-        if col in df.columns:
-            df[col] = df[col].apply(_to_text).astype("string")
-
-    # --- Also sanitize any remaining 'object' columns that look mixed (booleans/bytes) ---
-    for col in df.columns:
-        if df[col].dtype == "object" and col not in ALWAYS_STR_COLUMNS:
-            sample = df[col].dropna().head(20).tolist()
-            if any(isinstance(x, (bool, bytes, bytearray)) for x in sample):
-                df[col] = df[col].apply(_to_text).astype("string")
-
-    # Parse datetimes
-    for c in DATE_COLS:
-        if c in df.columns:
-            df[c] = pd.to_datetime(df[c], errors="coerce", utc=True)
-
-    # Partition column from epoch (day)
-    if "epoch" in df.columns:
-        df["epoch_date"] = df["epoch"].dt.date
-
-    return df
-
-def arrow_schema_for_df(df: pd.DataFrame) -> pa.Schema:
-    fields = []
-    for col in df.columns:
-        s = df[col]
-        if pd.api.types.is_datetime64_any_dtype(s.dtype):
-            # UTC timestamp in microseconds
-            t = pa.timestamp("us", tz="UTC")
-        elif pd.api.types.is_integer_dtype(s.dtype):
-            t = pa.int64()
-        elif pd.api.types.is_float_dtype(s.dtype):
-            t = pa.float64()
-        elif pd.api.types.is_bool_dtype(s.dtype):
-            t = pa.bool_()
-        elif col == "epoch_date":
-            # date partition column
-            t = pa.date32()
+def _flatten(rec: Dict) -> Dict:
+    # One level of nesting, same as pd.json_normalize(max_level=1): {"a": {"b": 1}} -> {"a.b": 1}
+    out = {}
+    for k, v in rec.items():
+        if isinstance(v, dict) and v:
+            for k2, v2 in v.items():
+                out[f"{k}.{k2}"] = v2
         else:
-            t = pa.string()
-        fields.append(pa.field(col, t))
-    return pa.schema(fields)
-
-def dedupe_keys(df: pd.DataFrame) -> pd.DataFrame:
-    keys = [c for c in ("satNo", "epoch", "idElset") if c in df.columns]
+            out[k] = v
+    return out
+
+def _typed_array(name: str, values: list) -> pa.Array:
+    typ = STATIC_SCHEMA.field(name).type
+    # Fast path, converted in C: values already match the column type (or cast to it
+    # losslessly), or (for dates) are ISO-8601 strings that Arrow's cast parses without per-value datetime objects
+    try:
+        if pa.types.is_timestamp(typ):
+            return pc.cast(pa.array(values, type=pa.string()), typ)
+        if pa.types.is_integer(typ):
+            # Infer, then safe-cast: pa.array(..., type=int64) would silently truncate 1.5 -> 1
+            return pa.array(values).cast(typ)
+        return pa.array(values, type=typ)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        pass
+    coerce = _COERCE[name]
+    return pa.array([None if v is None else coerce(v) for v in values], type=typ)
+
+def _extra_array(values: list) -> pa.Array:
+    # Columns outside STATIC_SCHEMA: let Arrow infer, stringify containers / mixed types
+    try:
+        arr = pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        return pa.array([_to_text(x) for x in values], type=pa.string())
+    if pa.types.is_nested(arr.type):
+        return pa.array([_dumps(x) if isinstance(x, (list, dict)) else _to_text(x) for x in values],
+                        type=pa.string())
+    return arr.cast(pa.string()) if pa.types.is_binary(arr.type) else arr
+
+def records_to_table(records: List[Dict]) -> pa.Table:
+    keep = set(COLUMNS_TO_KEEP) if COLUMNS_TO_KEEP else None
+    static = [n for n in STATIC_SCHEMA.names if n != "epoch_date" and (keep is None or n in keep)]
+    cols: Dict[str, list] = {name: [] for name in static}
+    extras: List[str] = []
+
+    # Single pass, one append per column per record (struct-of-arrays); coercion happens per column
+    for n, rec in enumerate(records):
+        flat = _flatten(rec)
+        for k in flat:
+            if k not in cols and (keep is None or k in keep):
+                cols[k] = [None] * n
+                extras.append(k)
+        for name, col in cols.items():
+            col.append(flat.get(name))
+
+    arrays = [_typed_array(n, cols[n]) for n in static]
+    fields = [STATIC_SCHEMA.field(n) for n in static]
+    for name in extras:
+        arr = _extra_array(cols[name])
+        arrays.append(arr)
+        fields.append(pa.field(name, arr.type))
+
+    # Partition column from epoch (UTC day)
+    if "epoch" in cols:
+        arrays.append(pc.cast(arrays[static.index("epoch")], pa.date32()))
+        fields.append(STATIC_SCHEMA.field("epoch_date"))
+
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+def dedupe_keys(table: pa.Table) -> pa.Table:
+    keys = [c for c in ("satNo", "epoch", "idElset")
+            if c in table.column_names and table[c].null_count < table.num_rows]
     if not keys:
-        return df
-    return df.sort_values(keys).drop_duplicates(subset=keys, keep="last")
-
-def write_chunk(ds_dir: Path, df: pd.DataFrame):
-    if df.empty:
+        return table
+    # keep="last": highest row index per key
+    idx = (table.select(keys)
+           .append_column("_row", pa.array(range(table.num_rows), type=pa.int64()))
+           .group_by(keys).aggregate([("_row", "max")])["_row_max"])
+    return table.take(idx.combine_chunks().sort())
+
+def _part_name() -> str:
+    # Time-prefixed so sorting part files by name puts them in write order (newest last)
+    return f"part-{time.time_ns():020d}-{uuid4().hex}.parquet"
+
+class _PartitionWriter:
+    # One open Parquet file per partition. ParquetWriter ends a row group on every write_table
+    # call, so chunks are buffered and written ROW_GROUP_SIZE rows at a time.
+    def __init__(self, out_dir: Path):
+        self.out_dir = out_dir
+        self.writer: Optional[pq.ParquetWriter] = None
+        self.pending: List[pa.Table] = []
+        self.rows = 0
+
+    def write(self, table: pa.Table):
+        if self.pending and not table.schema.equals(self.pending[0].schema):
+            # New extra column / type: finish the current file, start another
+            self.close()
+        self.pending.append(table)
+        self.rows += table.num_rows
+        while self.rows >= ROW_GROUP_SIZE:
+            buf = pa.concat_tables(self.pending)
+            self._write(buf.slice(0, ROW_GROUP_SIZE))
+            rest = buf.slice(ROW_GROUP_SIZE)
+            self.pending, self.rows = ([rest] if rest.num_rows else []), rest.num_rows
+
+    def _write(self, table: pa.Table):
+        if self.writer is None:
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            self.writer = pq.ParquetWriter(self.out_dir / _part_name(), table.schema, **PARQUET_WRITE_OPTIONS)
+        self.writer.write_table(table, row_group_size=ROW_GROUP_SIZE)
+
+    def close(self):
+        if self.pending:
+            self._write(pa.concat_tables(self.pending))
+            self.pending, self.rows = [], 0
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+def _writer_for(writers: Dict[str, _PartitionWriter], ds_dir: Path, part: str) -> _PartitionWriter:
+    if part not in writers:
+        writers[part] = _PartitionWriter(ds_dir / part if part else ds_dir)
+    return writers[part]
+
+def write_chunk(writers: Dict[str, _PartitionWriter], ds_dir: Path, table: pa.Table):
+    if table.num_rows == 0:
         return
-    # Ensure epoch_date is a date (not datetime64[ns, UTC] or object with datetime)
-    if "epoch_date" in df.columns and pd.api.types.is_datetime64_any_dtype(df["epoch_date"].dtype):
-        df["epoch_date"] = df["epoch_date"].dt.date
-
-    schema = arrow_schema_for_df(df)
-    table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
-
-    partition_cols = ["epoch_date"] if "epoch_date" in df.columns else []
-    pq.write_to_dataset(
-        table,
-        root_path=str(ds_dir),
-        partition_cols=partition_cols or None,
-        existing_data_behavior="overwrite_or_ignore",
-    )
-
-def process_all_json(raw_dir: Path, proc_dir: Path):
+    if "epoch_date" not in table.column_names:
+        _writer_for(writers, ds_dir, "").write(table)
+        return
+    # Split by day; the partition value lives in the directory name, not in the file
+    days = table["epoch_date"]
+    data = table.drop_columns(["epoch_date"])
+    for d in days.unique():
+        if d.is_valid:
+            sub, part = data.filter(pc.equal(days, d)), f"epoch_date={d.as_py().isoformat()}"
+        else:
+            sub, part = data.filter(pc.is_null(days)), f"epoch_date={NULL_PARTITION}"
+        _writer_for(writers, ds_dir, part).write(sub)
+
+def close_writers(writers: Dict[str, _PartitionWriter]):
+    # Flushes each partition's buffered tail as its last row group
+    for w in writers.values():
+        w.close()
+    writers.clear()
+
+def _drain_tables(tables: "queue.Queue[Optional[pa.Table]]", writers: Dict[str, _PartitionWriter],
+                  ds_dir: Path, errors: List[BaseException]):
+    # Writer thread: Parquet encode/compress runs in Arrow C++ without the GIL
+    while (table := tables.get()) is not None:
+        if errors:
+            continue  # keep draining so the producer never blocks on a full queue
+        try:
+            write_chunk(writers, ds_dir, table)
+        except BaseException as e:
+            errors.append(e)
+
+def process_one(fp: Path, proc_dir: Path) -> tuple[int, List[str]]:
+    # One JSON file -> Parquet; runs in a worker process, returns rows written and
+    # the partition directories (e.g. "epoch_date=2025-01-01") it wrote into.
+    # Parsing stays on this thread while a writer thread flushes the previous chunks;
+    # the bounded queue keeps at most a few chunks in memory.
+    n_rows = 0
+    writers: Dict[str, _PartitionWriter] = {}
+    tables: "queue.Queue[Optional[pa.Table]]" = queue.Queue(maxsize=4)
+    errors: List[BaseException] = []
+    writer = threading.Thread(target=_drain_tables, args=(tables, writers, proc_dir, errors), daemon=True)
+    writer.start()
+    try:
+        rec_iter = iter_records_any(fp)
+        for j, chunk in enumerate(to_chunks(rec_iter, chunk_size=50000), start=1):
+            if errors:
+                break
+            table = records_to_table(chunk)
+            if table.num_rows:
+                tables.put(table)
+                n_rows += table.num_rows
+                print(f"  - {fp.name}: queued chunk {j} ({table.num_rows:,} rows)")
+    finally:
+        tables.put(None)
+        writer.join()
+        parts = sorted(p for p in writers if p)
+        close_writers(writers)
+    if errors:
+        raise errors[0]
+    return n_rows, parts
+
+def dedupe_partition(part_dir: Path) -> int:
+    # Duplicates share an epoch, hence a day: dedupe each day across all its part files
+    # (every source file and earlier runs) and rewrite it only if something was dropped.
+    # Files are read oldest first, so keep="last" lets the newest write win.
+    # Returns the number of rows removed.
+    files = sorted(part_dir.glob("*.parquet"))
+    if not files:
+        return 0
+    try:
+        schema = pa.unify_schemas([pq.read_schema(f) for f in files])
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        print(f"  !! {part_dir.name}: incompatible part schemas, not deduped ({e})")
+        return 0
+    table = ds.dataset([str(f) for f in files], schema=schema, format="parquet").to_table()
+    deduped = dedupe_keys(table)
+    removed = table.num_rows - deduped.num_rows
+    if removed:
+        pq.write_table(deduped, part_dir / _part_name(),
+                       row_group_size=ROW_GROUP_SIZE, **PARQUET_WRITE_OPTIONS)
+        for f in files:
+            f.unlink()
+    return removed
+
+def file_fingerprint(fp: Path) -> str:
+    st = fp.stat()
+    return f"{fp.name}:{st.st_size}:{st.st_mtime_ns}"
+
+def load_manifest(proc_dir: Path) -> Dict[str, str]:
+    path = proc_dir / MANIFEST_NAME
+    return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+
+def save_manifest(proc_dir: Path, manifest: Dict[str, str]):
+    # write-then-rename so an interrupted run never leaves a truncated manifest
+    tmp = proc_dir / f"{MANIFEST_NAME}.tmp"
+    tmp.write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+    tmp.replace(proc_dir / MANIFEST_NAME)
+
+def process_all_json(raw_dir: Path, proc_dir: Path, max_workers: Optional[int] = None):
     json_files = sorted(list(raw_dir.glob("*.json")))
     if not json_files:
         print(f"No JSON files found in {raw_dir}")
         return
 
-    print(f"Found {len(json_files)} JSON files. Writing Parquet to: {proc_dir}")
-    for i, fp in enumerate(json_files, start=1):
-        print(f"[{i}/{len(json_files)}] {fp.name}")
-        rec_iter = iter_records_any(fp)
-        for j, chunk in enumerate(to_chunks(rec_iter, chunk_size=50000), start=1):
-            df = normalize_chunk(chunk)
-            if not df.empty:
-                df = dedupe_keys(df)
-                write_chunk(proc_dir, df)
-                print(f"  - wrote chunk {j} ({len(df):,} rows)")
+    # Skip files already converted (same name, size and mtime as a previous run).
+    # Manifest values: the partitions a file wrote while they still await dedupe, then "done";
+    # pending ones left by an interrupted run are picked up here.
+    manifest = load_manifest(proc_dir)
+    keys = {fp: file_fingerprint(fp) for fp in json_files}
+    todo = [fp for fp in json_files if keys[fp] not in manifest]
+    if len(todo) < len(json_files):
+        print(f"Skipping {len(json_files) - len(todo)} already processed JSON files")
+    touched = {p for v in manifest.values() if isinstance(v, list) for p in v}
+    if not todo and not touched:
+        print("Nothing to do.")
+        return
+
+    print(f"Found {len(todo)} JSON files. Writing Parquet to: {proc_dir}")
+    # Files are independent and every writer opens its own uniquely named part files,
+    # so they can be converted in parallel
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as ex:
+        for i, (fp, (n_rows, parts)) in enumerate(
+            zip(todo, ex.map(partial(process_one, proc_dir=proc_dir), todo)), start=1
+        ):
+            print(f"[{i}/{len(todo)}] {fp.name}: {n_rows:,} rows")
+            manifest[keys[fp]] = parts
+            touched.update(parts)
+            save_manifest(proc_dir, manifest)
+
+        # Only days written by this (or an interrupted) run can hold new duplicates
+        part_dirs = [proc_dir / p for p in sorted(touched)]
+        removed = sum(ex.map(dedupe_partition, part_dirs))
+        print(f"Removed {removed:,} duplicate rows across {len(part_dirs)} partitions")
+    for k, v in manifest.items():
+        if isinstance(v, list):
+            manifest[k] = "done"
+    save_manifest(proc_dir, manifest)
     print("Done.")
 
 if __name__ == "__main__":